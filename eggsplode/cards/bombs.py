@@ -40,7 +40,7 @@ async def eggsplode(
     if "defuse" in game.current_player_hand:
         game.current_player_hand.remove("defuse")
         if timed_out or interaction is None:
-            game.deck.insert(random.randint(0, len(game.deck)), "eggsplode")
+            game.deck.insert(random.randrange(len(game.deck) + 1), "eggsplode")
             await game.send(TextView("defused", game.current_player_id), interaction)
             return
         view = DefuseView(
@@ -84,7 +84,7 @@ async def radioeggtive(
     game: "Game", interaction: discord.Interaction | None, timed_out: bool = False
 ):
     if timed_out or interaction is None:
-        game.deck.insert(random.randint(0, len(game.deck)), "radioeggtive_face_up")
+        game.deck.insert(random.randrange(len(game.deck) + 1), "radioeggtive_face_up")
         await game.send(TextView("radioeggtive", game.current_player_id), interaction)
         return
     view = DefuseView(
@@ -39,9 +39,8 @@ def deck_count(game: "Game") -> str:
 
 
 def radioeggtive_warning(game: "Game") -> str:
-    radioeggtive_countdown = game.card_comes_in("radioeggtive_face_up")
     return (
         format_message("play_prompt_radioeggtive_now")
-        if radioeggtive_countdown == 0
+        if game.deck and game.deck[-1] == "radioeggtive_face_up"
         else ""
     )
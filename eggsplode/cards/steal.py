@@ -2,6 +2,7 @@
 Contains effects for cards that steal from other players.
 """
 
+import asyncio
 import random
 from typing import TYPE_CHECKING
 import discord
@@ -127,24 +128,29 @@ async def steal_finish(
         interaction,
     )
     try:
-        await interaction.respond(
-            view=TextView(
-                "stolen_card_you",
-                tooltip(stolen_card),
-                game.current_player_hand.count(stolen_card),
-            ),
-            ephemeral=True,
-        )
-        if target_interaction:
-            await target_interaction.respond(
+        responses = [
+            interaction.respond(
                 view=TextView(
-                    "stolen_card_them",
-                    game.current_player_id,
+                    "stolen_card_you",
                     tooltip(stolen_card),
-                    target_hand.count(stolen_card),
+                    game.current_player_hand.count(stolen_card),
                 ),
                 ephemeral=True,
             )
+        ]
+        if target_interaction:
+            responses.append(
+                target_interaction.respond(
+                    view=TextView(
+                        "stolen_card_them",
+                        game.current_player_id,
+                        tooltip(stolen_card),
+                        target_hand.count(stolen_card),
+                    ),
+                    ephemeral=True,
+                )
+            )
+        await asyncio.gather(*responses)
     finally:
         await game.events.action_end()
 
@@ -25,6 +25,9 @@ class Game:
         self.app = app
         self.config = config
         self.id = game_id
+        self.joined_players: set[int] = set(config.get("players", []))
+        self.creator_id: int | None = next(iter(config.get("players", [])), None)
+        self._player_list: str | None = None
         self.recipe_cards: dict[str, int | dict] = {}
         self.players: list[int] = []
         self.hands: dict[int, list[str]] = {}
@@ -35,6 +38,7 @@ class Game:
         self.remaining_turns: int = 0
         self.events = EventSet()
         self.last_activity = datetime.now()
+        self.timer_updated = asyncio.Event()
         self.active = True
         self.started = False
         self.paused = False
@@ -55,10 +59,27 @@ class Game:
         self.events.action_end += self.resume
         self.events.turn_start += self.resume
 
+    def add_joined_player(self, user_id: int):
+        self.config["players"].append(user_id)
+        self.joined_players.add(user_id)
+        if self.creator_id is None:
+            self.creator_id = user_id
+        if self._player_list is not None:
+            self._player_list = (
+                self._player_list + "\n" if self._player_list else ""
+            ) + format_message("players_list_item", user_id)
+
+    def remove_joined_player(self, user_id: int):
+        self.config["players"].remove(user_id)
+        self.joined_players.discard(user_id)
+        if user_id == self.creator_id:
+            self.creator_id = next(iter(self.config["players"]), None)
+        self._player_list = None
+
     def setup(self):
         self.load_recipe(self.config["recipe"])
 
-    def load_recipe(self, recipe: str | bytes | bytearray | dict):
+    def load_recipe(self, recipe: str | bytes | bytearray | dict) -> dict:
         if not isinstance(recipe, dict):
             recipe = json.loads(recipe)
         if not isinstance(recipe, dict):
@@ -107,6 +128,7 @@ class Game:
         self.trim_deck()
         self.ensure_minimum_eggsplode()
         self.shuffle_deck()
+        return recipe
 
     def hand_out(self, recipe: dict, hand_out_pool: list):
         max_cards_per_player = min(
@@ -115,16 +137,17 @@ class Game:
         random.shuffle(hand_out_pool)
         for hand in self.hands.values():
             while len(hand) < max_cards_per_player:
-                hand.append(
-                    hand_out_pool.pop(random.randint(0, len(hand_out_pool) - 1))
-                )
+                hand.append(hand_out_pool.pop())
 
     def ensure_minimum_eggsplode(self):
-        while (
-            self.deck.count("eggsplode") + self.deck.count("radioeggtive")
-            < len(self.players) - 1
-        ):
-            self.deck.append("eggsplode")
+        missing = (
+            len(self.players)
+            - 1
+            - self.deck.count("eggsplode")
+            - self.deck.count("radioeggtive")
+        )
+        if missing > 0:
+            self.deck += ["eggsplode"] * missing
 
     def trim_deck(self):
         max_deck_size = self.config.get("deck_size", None)
@@ -215,10 +238,12 @@ class Game:
 
     @property
     def player_list(self) -> str:
-        return "\n".join(
-            format_message("players_list_item", player)
-            for player in self.config["players"]
-        )
+        if self._player_list is None:
+            self._player_list = "\n".join(
+                format_message("players_list_item", player)
+                for player in self.config["players"]
+            )
+        return self._player_list
 
     async def next_turn(self):
         self.action_id += 1
@@ -233,17 +258,16 @@ class Game:
         await self.events.turn_start()
 
     def group_hand(self, user_id: int, usable_only: bool = False) -> dict[str, int]:
-        player_cards = self.hands[user_id]
-        result = {}
-        for card in player_cards:
-            if usable_only:
-                if not available_cards[card].get("usable", False):
-                    continue
-                if player_cards.count(card) < available_cards[card].get("combo", 0):
-                    continue
-            if card in result:
-                continue
-            result[card] = player_cards.count(card)
+        result: dict[str, int] = {}
+        for card in self.hands[user_id]:
+            result[card] = result.get(card, 0) + 1
+        if usable_only:
+            result = {
+                card: count
+                for card, count in result.items()
+                if available_cards[card].get("usable", False)
+                and count >= available_cards[card].get("combo", 0)
+            }
         return result
 
     async def play(self, interaction: discord.Interaction, card: str):
@@ -365,37 +389,36 @@ class Game:
             if any(card in self.hands[player] for card in card_names)
         ]
 
-    def hand_sizes(self) -> dict[int, int]:
-        return {player: len(hand) for player, hand in self.hands.items()}
-
     def any_player_has_cards(
         self, exclude_player_id: int | None = None, min_cards: int = 1
     ) -> bool:
-        sizes = self.hand_sizes()
-        if exclude_player_id is not None:
-            sizes.pop(exclude_player_id, None)
-        if not sizes:
-            return False
-        return max(sizes.values()) >= min_cards
-
-    def card_comes_in(self, card) -> int | None:
-        for i in range(len(self.deck) - 1, -1, -1):
-            if self.deck[i] == card:
-                return len(self.deck) - 1 - i
-        return None
+        return any(
+            len(hand) >= min_cards
+            for player, hand in self.hands.items()
+            if player != exclude_player_id
+        )
 
     def reverse(self):
         self.players = self.players[::-1]
         self.current_player = len(self.players) - self.current_player - 1
 
     async def action_timer(self):
+        turn_timeout = timedelta(seconds=float(self.config.get("turn_timeout", 40)))
         while self.active:
-            if (
-                datetime.now() - self.last_activity
-                > timedelta(seconds=float(self.config.get("turn_timeout", 40)))
-            ) and not self.paused:
+            self.timer_updated.clear()
+            if self.paused:
+                await self.timer_updated.wait()
+                continue
+            remaining = (
+                self.last_activity + turn_timeout - datetime.now()
+            ).total_seconds()
+            if remaining < 0:
                 await self.on_action_timeout()
-            await asyncio.sleep(5)
+                continue
+            try:
+                await asyncio.wait_for(self.timer_updated.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
 
     async def on_action_timeout(self):
         if not self.active:
@@ -426,9 +449,11 @@ class Game:
 
     def reset_timer(self):
         self.last_activity = datetime.now()
+        self.timer_updated.set()
 
     async def end(self):
         self.active = False
+        self.timer_updated.set()
         self.started = False
         self.paused = False
         self.current_player = 0
@@ -488,7 +513,9 @@ class Game:
 
     @property
     def warnings(self) -> str:
-        return "\n".join(warning(self) for warning in self.turn_warnings)
+        return "\n".join(
+            text for warning in self.turn_warnings if (text := warning(self))
+        )
 
     def __bool__(self) -> bool:
         return self.active
@@ -517,6 +544,9 @@ class Event:
             if inspect.isawaitable(r):
                 await r
 
+    def __contains__(self, callback) -> bool:
+        return callback in self._subscribers
+
     __call__ = notify
     __add__ = subscribe
     __sub__ = unsubscribe
@@ -2,6 +2,7 @@
 Common strings used by modules.
 """
 
+import functools
 import os
 import json
 import random
@@ -67,6 +68,7 @@ def get_card_by_title(title: str, match_case: bool = False) -> str:
     raise ValueError(f"Card with title '{title}' not found.")
 
 
+@functools.lru_cache(maxsize=None)
 def tooltip(card: str, emoji=True) -> str:
     if card not in available_cards:
         raise ValueError(f"Card '{card}' not found in CARDS.")
@@ -36,7 +36,7 @@ class NopeView(BaseGameView):
                 else strings.EXPLICIT_NOPE_TIMEOUT
             )
         self.nope_timeout = timeout
-        self._is_timer_awaiting_reset = False
+        self._timer_reset = asyncio.Event()
         self.game = game
         self.action_messages = [message]
         self.target_player_id = target_player_id
@@ -71,14 +71,12 @@ class NopeView(BaseGameView):
 
     async def _run_timer(self):
         try:
-            start_time = datetime.now()
             while True:
-                if self._is_timer_awaiting_reset:
-                    self._is_timer_awaiting_reset = False
-                    start_time = datetime.now()
-                if datetime.now() - start_time >= timedelta(seconds=self.nope_timeout):
+                self._timer_reset.clear()
+                try:
+                    await asyncio.wait_for(self._timer_reset.wait(), self.nope_timeout)
+                except asyncio.TimeoutError:
                     break
-                await asyncio.sleep(0.1)
             await self.on_nope_timeout()
         except asyncio.CancelledError:
             pass
@@ -94,7 +92,7 @@ class NopeView(BaseGameView):
             await self.message.edit(view=self)
 
     def reset_timeout(self):
-        self._is_timer_awaiting_reset = True
+        self._timer_reset.set()
 
     @property
     def ok_label(self) -> str:
@@ -15,6 +15,13 @@ from eggsplode.ui.base import BaseView, TextView
 if TYPE_CHECKING:
     from eggsplode.core import Game
 
+_PLAY_SECTION_TEXTS = {
+    card: format_message(
+        "play_section", data["emoji"], data["title"], data["description"]
+    )
+    for card, data in available_cards.items()
+}
+
 
 class PlayView(BaseView):
     MAX_SECTIONS = (MAX_COMPONENTS - 5) // 3
@@ -78,18 +85,11 @@ class PlayView(BaseView):
                 )
             )
             section = discord.ui.Section(
-                discord.ui.TextDisplay(
-                    format_message(
-                        "play_section",
-                        available_cards[card]["emoji"],
-                        available_cards[card]["title"],
-                        available_cards[card]["description"],
-                    )
-                ),
+                discord.ui.TextDisplay(_PLAY_SECTION_TEXTS[card]),
                 accessory=discord.ui.Button(
                     label=("Play " if card_playable else "") + f"({count}x)",
                     style=discord.ButtonStyle.secondary,
-                    emoji=replace_emojis(available_cards[card]["emoji"]),
+                    emoji=replace_emojis(card_properties["emoji"]),
                     disabled=not card_playable,
                 ),
             )
@@ -2,6 +2,7 @@
 Contains the views for the short interactions in the game, such as "Defuse".
 """
 
+import copy
 from typing import Callable, Coroutine, TYPE_CHECKING
 import discord
 
@@ -11,6 +12,18 @@ from eggsplode.ui.base import BaseView
 if TYPE_CHECKING:
     from eggsplode.core import Game
 
+_CARD_OPTIONS = {
+    card: discord.SelectOption(
+        value=card,
+        label=data["title"],
+        emoji=data.get("emoji", None),
+        description=(
+            data["description"][:99] if data.get("description", None) else None
+        ),
+    )
+    for card, data in available_cards.items()
+}
+
 
 class SelectionView(BaseView):
     def __init__(self, timeout: int = 20):
@@ -145,21 +158,11 @@ class ChooseCardView(BaseView):
         return False
 
     async def create_card_selection(self):
-        options = [
-            discord.SelectOption(
-                value=card,
-                label=format_message(
-                    "card_with_count", available_cards[card]["title"], count
-                ),
-                emoji=available_cards[card].get("emoji", None),
-                description=(
-                    available_cards[card]["description"][:99]
-                    if available_cards[card].get("description", None)
-                    else None
-                ),
-            )
-            for card, count in self.target_hand.items()
-        ]
+        options = []
+        for card, count in self.target_hand.items():
+            option = copy.copy(_CARD_OPTIONS[card])
+            option.label = format_message("card_with_count", option.label, count)
+            options.append(option)
         self.card_select = discord.ui.Select(
             placeholder=format_message("select_card_placeholder"),
             min_values=self.min_cards,
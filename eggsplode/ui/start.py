@@ -3,11 +3,12 @@ Contains the StartGameView class which handles the start game view in the Discor
 """
 
 import asyncio
+import copy
 import datetime
 import json
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 import psutil
 import discord
 from eggsplode.strings import (
@@ -35,9 +36,114 @@ COVERED_RECIPE_EXCEPTIONS = (
     ZeroDivisionError,
 )
 
+MEMORY_CACHE_TTL = 10
+APP_INFO_CACHE_TTL = 60
+PLAYERS_UPDATE_DELAY = 0.1
+
+_info_cache: dict[str, tuple[float, Any]] = {}
+_info_refresh_locks = {"memory": asyncio.Lock(), "application_info": asyncio.Lock()}
+_BOOT_TIME = psutil.boot_time()
+
+_STATIC_MESSAGES = {
+    key: format_message(key)
+    for key in (
+        "start",
+        "players",
+        "settings",
+        "recipe",
+        "recipe_description",
+        "advanced_settings",
+        "advanced_settings_description",
+        "help0",
+        "edit_recipe_title",
+        "recipe_help",
+        "recipe_json_label",
+        "start_button",
+        "join_button",
+        "help_button",
+        "edit_button",
+        "view_button",
+        "recipe_custom_placeholder",
+        "leave_game_warning",
+        "leave_game_button",
+        "end_game_warning",
+        "end_game_button",
+        "game_timeout",
+        "game_cancelled",
+        "started",
+        "balancing_settings_title",
+        "settings_updated",
+        "maintenance",
+    )
+}
+
+_EMOJI_GLOBE = replace_emojis("🌐")
+_EMOJI_SPEECH = replace_emojis("💬")
+
+_INFO_LINKS = (
+    (
+        format_message("link_online_help_label"),
+        format_message("link_online_help_url"),
+        "❓",
+    ),
+    (
+        format_message("link_website_label"),
+        format_message("link_website_url"),
+        _EMOJI_GLOBE,
+    ),
+    (
+        format_message("link_official_server_label"),
+        format_message("link_official_server_url"),
+        _EMOJI_SPEECH,
+    ),
+    (format_message("link_vote_label"), format_message("link_vote_url"), "🎉"),
+    (
+        format_message("link_support_label"),
+        format_message("link_support_url"),
+        "♥️",
+    ),
+)
+_RECIPE_INPUT_KWARGS = {
+    "style": discord.InputTextStyle.long,
+    "placeholder": app_messages["recipe_json_placeholder"],
+    "required": True,
+    "min_length": 2,
+    "max_length": 4000,
+}
+_CHANGELOG_LINK = (
+    format_message("changelog_button"),
+    format_message("link_changelog_url"),
+    "📜",
+)
+_INSTALL_LINK = (
+    format_message("install_button"),
+    format_message("link_install_url"),
+    "➕",
+)
+_FORMAT_STATUS_LATENCY = replace_emojis(app_messages["status_latency"]).format
+_FORMAT_STATUS_UPTIME = replace_emojis(app_messages["status_uptime"]).format
+_FORMAT_STATUS_MEMORY = replace_emojis(app_messages["status_memory"]).format
+_FORMAT_STATUS_INSTALLS = replace_emojis(app_messages["status_installs"]).format
+_VERSION_EGGSPLODE = format_message("version_eggsplode", app_info["version"])
+_VERSION_PYCORD = format_message("version_pycord", discord.__version__)
+
+_RECIPE_OPTIONS = [
+    discord.SelectOption(
+        value=id,
+        label=recipe["name"],
+        description=recipe["description"][:99],
+        emoji=replace_emojis(recipe["emoji"]),
+    )
+    for id, recipe in default_recipes.items()
+]
+
+
+def is_game_creator(game: "Game", interaction: discord.Interaction) -> bool:
+    return interaction.user is not None and interaction.user.id == game.creator_id
+
 
 async def check_permissions(game: "Game", interaction: discord.Interaction):
-    if (not interaction.user) or interaction.user.id != game.config["players"][0]:
+    if not is_game_creator(game, interaction):
         await interaction.respond(
             view=TextView("not_game_creator"),
             ephemeral=True,
@@ -54,12 +160,13 @@ class StartGameView(BaseView):
         self.game.events.game_end += self.terminate_view
         self.game.config["recipe_id"] = "classic"
         self.game.config["recipe"] = default_recipes["classic"]
+        self._recipe_json: str | None = None
 
         self.header = discord.ui.Section()
-        self.title = discord.ui.TextDisplay(format_message("start"))
+        self.title = discord.ui.TextDisplay(_STATIC_MESSAGES["start"])
         self.header.add_item(self.title)
         self.start_game_button = discord.ui.Button(
-            label=format_message("start_button"),
+            label=_STATIC_MESSAGES["start_button"],
             style=discord.ButtonStyle.green,
             emoji="🚀",
         )
@@ -69,60 +176,64 @@ class StartGameView(BaseView):
 
         self.players_container = discord.ui.Container()
         self.join_game_button = discord.ui.Button(
-            label=format_message("join_button"),
+            label=_STATIC_MESSAGES["join_button"],
             style=discord.ButtonStyle.blurple,
             emoji="👋",
         )
         self.join_game_button.callback = self.join_game
         self.players_container.add_section(
-            discord.ui.TextDisplay(format_message("players")),
+            discord.ui.TextDisplay(_STATIC_MESSAGES["players"]),
             accessory=self.join_game_button,
         )
         self.players_display = discord.ui.TextDisplay(self.game.player_list)
+        self.rendered_players = tuple(self.game.config["players"])
+        self.players_update_task: asyncio.Task[None] | None = None
+        self.players_update_interaction: discord.Interaction | None = None
+        self.leave_views: dict[int, LeaveGameView] = {}
         self.players_container.add_item(self.players_display)
         self.add_item(self.players_container)
 
         self.help_button = discord.ui.Button(
-            label=format_message("help_button"),
+            label=_STATIC_MESSAGES["help_button"],
             style=discord.ButtonStyle.secondary,
             emoji="❓",
         )
         self.help_button.callback = self.help
         self.settings_container = discord.ui.Container()
         self.settings_container.add_section(
-            discord.ui.TextDisplay(format_message("settings")),
+            discord.ui.TextDisplay(_STATIC_MESSAGES["settings"]),
             accessory=self.help_button,
         )
         self.recipe_select = discord.ui.Select(
             options=self.recipe_options,
-            placeholder=format_message("recipe_custom_placeholder"),
+            placeholder=_STATIC_MESSAGES["recipe_custom_placeholder"],
             min_values=1,
             max_values=1,
         )
         self.recipe_select.callback = self.recipe_callback
         self.edit_recipe_button = discord.ui.Button(
-            label=format_message("edit_button"),
+            label=_STATIC_MESSAGES["edit_button"],
             style=discord.ButtonStyle.secondary,
             emoji="✏️",
         )
         self.edit_recipe_button.callback = self.edit_recipe
         self.settings_container.add_section(
-            discord.ui.TextDisplay(format_message("recipe")),
-            discord.ui.TextDisplay(format_message("recipe_description")),
+            discord.ui.TextDisplay(_STATIC_MESSAGES["recipe"]),
+            discord.ui.TextDisplay(_STATIC_MESSAGES["recipe_description"]),
             accessory=self.edit_recipe_button,
         )
         self.recipe_action_row = discord.ui.ActionRow(self.recipe_select)
         self.settings_container.add_item(self.recipe_action_row)
         self.settings_container.add_separator()
         self.advanced_settings_button = discord.ui.Button(
-            label=format_message("view_button"),
+            label=_STATIC_MESSAGES["view_button"],
             style=discord.ButtonStyle.secondary,
             emoji="⚙️",
         )
         self.advanced_settings_button.callback = self.advanced_settings
         self.settings_container.add_section(
-            discord.ui.TextDisplay(format_message("advanced_settings")),
-            discord.ui.TextDisplay(format_message("advanced_settings_description")),
+            discord.ui.TextDisplay(_STATIC_MESSAGES["advanced_settings"]),
+            discord.ui.TextDisplay(_STATIC_MESSAGES["advanced_settings_description"]),
             accessory=self.advanced_settings_button,
         )
         self.add_item(self.settings_container)
@@ -131,39 +242,75 @@ class StartGameView(BaseView):
         if not self.is_ignoring_interactions:
             self.ignore_interactions()
             await self.game.events.game_end()
-            self.title.content = format_message("game_timeout")
+            self.title.content = _STATIC_MESSAGES["game_timeout"]
             await super().on_timeout()
 
     async def join_game(self, interaction: discord.Interaction):
         if not interaction.user:
             return
         await interaction.response.defer(invisible=True)
-        if interaction.user.id in self.game.config["players"]:
+        self.players_update_interaction = interaction
+        if interaction.user.id in self.game.joined_players:
             await interaction.respond(
-                view=LeaveGameView(self, interaction.user.id), ephemeral=True
+                view=self.get_leave_view(interaction.user.id), ephemeral=True
             )
             return
-        self.game.config["players"].append(interaction.user.id)
-        self.players_display.content = self.game.player_list
-        await interaction.edit(view=self)
+        self.game.add_joined_player(interaction.user.id)
+        if self.message is None:
+            await self.update_players_display()
+            return
+        self.schedule_players_update()
+
+    def get_leave_view(self, user_id: int) -> "LeaveGameView":
+        view = self.leave_views.get(user_id)
+        if view is None or view.is_ignoring_interactions:
+            view = self.leave_views[user_id] = LeaveGameView(self, user_id)
+        return view
 
     async def remove_player(self, user_id: int):
         if not self.message:
             return
-        self.game.config["players"].remove(user_id)
-        self.players_display.content = self.game.player_list
-        if not self.game.config["players"]:
-            self.title.content = format_message("game_cancelled")
-            await self.game.events.game_end()
-        await self.message.edit(view=self)
+        self.leave_views.pop(user_id, None)
+        self.game.remove_joined_player(user_id)
+        if self.game.config["players"]:
+            self.schedule_players_update()
+            return
+        self.title.content = _STATIC_MESSAGES["game_cancelled"]
+        await self.game.events.game_end()
+        await self.edit_lobby()
+
+    def schedule_players_update(self):
+        if self.players_update_task is None or self.players_update_task.done():
+            self.players_update_task = asyncio.create_task(
+                self.update_players_display(delay=PLAYERS_UPDATE_DELAY)
+            )
+
+    async def update_players_display(self, delay: float = 0):
+        if delay:
+            await asyncio.sleep(delay)
+        try:
+            players = tuple(self.game.config["players"])
+            while players != self.rendered_players:
+                self.players_display.content = self.game.player_list
+                await self.edit_lobby()
+                self.rendered_players = players
+                players = tuple(self.game.config["players"])
+        except discord.HTTPException:
+            logger.exception("Game %s: Failed to update player list.", self.game.id)
+
+    async def edit_lobby(self):
+        if self.players_update_interaction is not None:
+            await self.players_update_interaction.edit_original_response(view=self)
+        elif self.message is not None:
+            await self.message.edit(view=self)
 
     def terminate_view(self):
-        if not self.is_ignoring_interactions:
-            self.ignore_interactions()
-            self.remove_item(self.players_container)
-            self.remove_item(self.settings_container)
-            self.remove_item(self.join_game_button)
-            self.header.accessory = discord.ui.Button(emoji="🚫", disabled=True)
+        self.game.events.game_end -= self.terminate_view
+        if self.is_ignoring_interactions:
+            return
+        self.ignore_interactions()
+        self.clear_items().add_item(self.header)
+        self.header.accessory = discord.ui.Button(emoji="🚫", disabled=True)
 
     async def start_game(self, interaction: discord.Interaction):
         if not await check_permissions(self.game, interaction):
@@ -175,10 +322,9 @@ class StartGameView(BaseView):
                 delete_after=5,
             )
             return
-        await interaction.response.defer()
         self.ignore_interactions()
         self.disable_all_items()
-        self.start_game_button.label = format_message("started")
+        self.start_game_button.label = _STATIC_MESSAGES["started"]
         await interaction.edit(view=self)
 
         async def run_game():
@@ -196,24 +342,35 @@ class StartGameView(BaseView):
 
     @property
     def recipe_options(self) -> list[discord.SelectOption]:
-        return [
-            discord.SelectOption(
-                value=id,
-                label=recipe["name"],
-                description=recipe["description"][:99],
-                emoji=replace_emojis(recipe["emoji"]),
-                default=id == self.game.config["recipe_id"],
-            )
-            for id, recipe in default_recipes.items()
-        ]
+        options = [copy.copy(option) for option in _RECIPE_OPTIONS]
+        for option in options:
+            option.default = option.value == self.game.config["recipe_id"]
+        return options
+
+    @property
+    def recipe_json(self) -> str:
+        if self._recipe_json is None:
+            self._recipe_json = json.dumps(self.game.config["recipe"], indent=2)
+        return self._recipe_json
+
+    @recipe_json.setter
+    def recipe_json(self, value: str | None):
+        self._recipe_json = value
+
+    def update_recipe_defaults(self):
+        for option in self.recipe_select.options:
+            option.default = option.value == self.game.config["recipe_id"]
 
     async def recipe_callback(self, interaction: discord.Interaction):
-        await interaction.edit(view=self)
-        if await check_permissions(self.game, interaction):
+        permitted = is_game_creator(self.game, interaction)
+        if permitted:
             recipe_id = self.game.config["recipe_id"] = self.recipe_select.values[0]
             self.game.config["recipe"] = default_recipes[recipe_id]
-        self.recipe_select.options = self.recipe_options
+            self.recipe_json = None
+        self.update_recipe_defaults()
         await interaction.edit(view=self)
+        if not permitted:
+            await check_permissions(self.game, interaction)
 
     async def advanced_settings(self, interaction: discord.Interaction):
         await interaction.response.send_modal(SettingsModal(self.game))  # type: ignore
@@ -224,24 +381,18 @@ class StartGameView(BaseView):
 
 class EditRecipeModal(discord.ui.DesignerModal):
     def __init__(self, parent_view: StartGameView, *args, **kwargs):
-        super().__init__(*args, **kwargs, title=format_message("edit_recipe_title"))
+        super().__init__(*args, **kwargs, title=_STATIC_MESSAGES["edit_recipe_title"])
         self.parent_view = parent_view
-        self.parent_message = self.parent_view.message
-        if self.parent_message is None:
+        if self.parent_view.message is None:
             raise TypeError("StartGameView message ID is None")
         self.game = parent_view.game
-        self.recipe_help = discord.ui.TextDisplay(format_message("recipe_help"))
+        self.recipe_help = discord.ui.TextDisplay(_STATIC_MESSAGES["recipe_help"])
         self.add_item(self.recipe_help)
         self.recipe_input = discord.ui.InputText(
-            style=discord.InputTextStyle.long,
-            value=json.dumps(self.game.config["recipe"], indent=2),
-            placeholder=app_messages["recipe_json_placeholder"],
-            required=True,
-            min_length=2,
-            max_length=4000,
+            value=self.parent_view.recipe_json, **_RECIPE_INPUT_KWARGS
         )
         self.recipe_input_label = discord.ui.Label(
-            format_message("recipe_json_label"), self.recipe_input
+            _STATIC_MESSAGES["recipe_json_label"], self.recipe_input
         )
         self.add_item(self.recipe_input_label)
 
@@ -249,109 +400,106 @@ class EditRecipeModal(discord.ui.DesignerModal):
         recipe_json = self.recipe_input.value
         if recipe_json is None:
             return
-        if self.parent_message is None:
-            raise TypeError("StartGameView message ID is None")
         if not self.game:
             return
         if not await check_permissions(self.game, interaction):
             return
         await interaction.response.defer()
         try:
-            self.game.load_recipe(recipe_json)
+            recipe = self.game.load_recipe(recipe_json)
         except COVERED_RECIPE_EXCEPTIONS as e:
             await interaction.respond(
                 view=TextView("recipe_json_error", e, recipe_json), ephemeral=True
             )
             return
-        self.game.config["recipe"] = json.loads(recipe_json)
+        self.game.config["recipe"] = recipe
         self.game.config["recipe_id"] = ""
-        self.parent_view.recipe_select.options = self.parent_view.recipe_options
+        self.parent_view.recipe_json = recipe_json
+        self.parent_view.update_recipe_defaults()
+        parent_message = self.parent_view.message
+        if parent_message is None:
+            raise TypeError("StartGameView message ID is None")
         await interaction.followup.edit_message(
-            self.parent_message.id, view=self.parent_view
+            parent_message.id, view=self.parent_view
         )
 
     def clear_items(self) -> None: ...
 
 
 class SettingsModal(discord.ui.DesignerModal):
+    # (config key, label, placeholder, minimum, maximum)
+    SCHEMA: tuple[tuple[str, str, str, int | None, int | None], ...] = (
+        ("deck_size", format_message("setting_label_deck_size"), "", None, None),
+        (
+            "turn_timeout",
+            format_message("setting_label_turn_timeout"),
+            format_message("setting_placeholder_turn_timeout"),
+            10,
+            120,
+        ),
+    )
+
     def __init__(self, game: "Game", *args, **kwargs):
         super().__init__(
-            *args, **kwargs, title=format_message("balancing_settings_title")
+            *args, **kwargs, title=_STATIC_MESSAGES["balancing_settings_title"]
         )
         self.game = game
-        self.inputs = {
-            "deck_size": {
-                "label": format_message("setting_label_deck_size"),
-                "input": discord.ui.InputText(
-                    placeholder="",
-                    value=self.game.config.get("deck_size", None),
-                    required=False,
-                ),
-            },
-            "turn_timeout": {
-                "label": format_message("setting_label_turn_timeout"),
-                "input": discord.ui.InputText(
-                    placeholder=format_message("setting_placeholder_turn_timeout"),
-                    value=self.game.config.get("turn_timeout", None),
-                    required=False,
-                ),
-                "min": 10,
-                "max": 120,
-            },
-        }
-        for i in self.inputs.values():
-            self.add_item(discord.ui.Label(i["label"], i["input"]))
+        self.inputs: list[
+            tuple[str, str, discord.ui.InputText, int | None, int | None]
+        ] = []
+        for input_name, label, placeholder, min_value, max_value in self.SCHEMA:
+            item_input = discord.ui.InputText(
+                placeholder=placeholder,
+                value=self.game.config.get(input_name, None),
+                required=False,
+            )
+            self.inputs.append((input_name, label, item_input, min_value, max_value))
+            self.add_item(discord.ui.Label(label, item_input))
 
     async def callback(self, interaction: discord.Interaction):
         if not self.game:
             return
         if not await check_permissions(self.game, interaction):
             return
-        response = format_message("settings_updated")
-        for input_name, item in self.inputs.items():
-            item_input = item["input"]
-            item_label = item["label"]
+        response = [_STATIC_MESSAGES["settings_updated"]]
+        for input_name, item_label, item_input, min_value, max_value in self.inputs:
             if item_input.value == "":
                 self.game.config.pop(input_name, None)
-                response += "\n" + format_message(
-                    "settings_updated_success", item_label, item_input.placeholder
+                response.append(
+                    format_message(
+                        "settings_updated_success", item_label, item_input.placeholder
+                    )
                 )
                 continue
-            if not (
-                validation := self.validate(
-                    item_input.value,
-                    int,
-                    item.get("min", None),
-                    item.get("max", None),
-                )
-            )[0]:
-                response += "\n" + format_message(
-                    "settings_updated_error",
-                    item_label,
-                    item_input.value,
-                    validation[1],
+            valid, error = self.validate(item_input.value, int, min_value, max_value)
+            if not valid:
+                response.append(
+                    format_message(
+                        "settings_updated_error", item_label, item_input.value, error
+                    )
                 )
                 continue
             self.game.config[input_name] = item_input.value
-            response += "\n" + format_message(
-                "settings_updated_success", item_label, item_input.value
+            response.append(
+                format_message("settings_updated_success", item_label, item_input.value)
             )
         await interaction.respond(
-            view=TextView(response, verbatim=True), ephemeral=True, delete_after=5
+            view=TextView("\n".join(response), verbatim=True),
+            ephemeral=True,
+            delete_after=5,
         )
 
     @staticmethod
     def validate(value, required_type=None, min_value=None, max_value=None):
-        if required_type and not isinstance(value, required_type):
+        if required_type is not None and not isinstance(value, required_type):
             try:
                 value = required_type(value)
             except ValueError:
-                return False, format_message(
-                    "validate_must_be_type", required_type.__name__
-                )
-        if min_value and value < min_value:
+                type_name = required_type.__name__
+                return False, format_message("validate_must_be_type", type_name)
+        if min_value is not None and value < min_value:
             return False, format_message("validate_minimum", min_value)
-        if max_value and value > max_value:
+        if max_value is not None and value > max_value:
             return False, format_message("validate_maximum", max_value)
         return True, ""
 
@@ -361,7 +509,7 @@ class SettingsModal(discord.ui.DesignerModal):
 class HelpView(discord.ui.DesignerView):
     def __init__(self):
         super().__init__(timeout=None)
-        self.help_text = discord.ui.TextDisplay(format_message("help0"))
+        self.help_text = discord.ui.TextDisplay(_STATIC_MESSAGES["help0"])
         self.button_row = InfoLinkRow()
         self.add_item(self.help_text).add_item(self.button_row)
 
@@ -372,10 +520,11 @@ class LeaveGameView(BaseView):
         self.parent_view = parent_view
         self.game = parent_view.game
         self.user_id = user_id
-        self.warning = discord.ui.TextDisplay(format_message("leave_game_warning"))
+        self.warning = discord.ui.TextDisplay(_STATIC_MESSAGES["leave_game_warning"])
         self.add_item(self.warning)
         self.confirm_button = discord.ui.Button(
-            label=format_message("leave_game_button"), style=discord.ButtonStyle.danger
+            label=_STATIC_MESSAGES["leave_game_button"],
+            style=discord.ButtonStyle.danger,
         )
         self.confirm_button.callback = self.leave_game_callback
         self.action_row = discord.ui.ActionRow(self.confirm_button)
@@ -386,23 +535,23 @@ class LeaveGameView(BaseView):
             not self.game
             or self.game.started
             or not interaction.user
-            or interaction.user.id not in self.game.config["players"]
+            or interaction.user.id not in self.game.joined_players
         ):
             return
         self.ignore_interactions()
-        await self.parent_view.remove_player(self.user_id)
         self.disable_all_items()
         await interaction.edit(delete_after=0, view=self)
+        await self.parent_view.remove_player(self.user_id)
 
 
 class EndGameView(BaseView):
     def __init__(self, game: "Game"):
         super().__init__(timeout=30, disable_on_timeout=True)
         self.game = game
-        self.warning = discord.ui.TextDisplay(format_message("end_game_warning"))
+        self.warning = discord.ui.TextDisplay(_STATIC_MESSAGES["end_game_warning"])
         self.add_item(self.warning)
         self.button = discord.ui.Button(
-            label=format_message("end_game_button"), style=discord.ButtonStyle.danger
+            label=_STATIC_MESSAGES["end_game_button"], style=discord.ButtonStyle.danger
         )
         self.button.callback = self.end_game_callback
         self.action_row = discord.ui.ActionRow(self.button)
@@ -422,37 +571,8 @@ class EndGameView(BaseView):
 class InfoLinkRow(discord.ui.ActionRow):
     def __init__(self):
         super().__init__()  # pylint: disable=no-value-for-parameter
-        self.add_item(
-            discord.ui.Button(
-                label=format_message("link_online_help_label"),
-                url=format_message("link_online_help_url"),
-                emoji="❓",
-            )
-        ).add_item(
-            discord.ui.Button(
-                label=format_message("link_website_label"),
-                url=format_message("link_website_url"),
-                emoji=replace_emojis("🌐"),
-            )
-        ).add_item(
-            discord.ui.Button(
-                label=format_message("link_official_server_label"),
-                url=format_message("link_official_server_url"),
-                emoji=replace_emojis("💬"),
-            )
-        ).add_item(
-            discord.ui.Button(
-                label=format_message("link_vote_label"),
-                url=format_message("link_vote_url"),
-                emoji="🎉",
-            )
-        ).add_item(
-            discord.ui.Button(
-                label=format_message("link_support_label"),
-                url=format_message("link_support_url"),
-                emoji="♥️",
-            )
-        )
+        for link in _INFO_LINKS:
+            self.add_item(link_button(link))
 
 
 class InfoView(discord.ui.DesignerView):
@@ -466,52 +586,79 @@ class InfoView(discord.ui.DesignerView):
 
     async def create_container(self):
         self.container.add_section(
-            discord.ui.TextDisplay(
-                format_message("version_eggsplode", app_info["version"])
-            ),
-            discord.ui.TextDisplay(
-                format_message("version_pycord", discord.__version__)
-            ),
-            accessory=discord.ui.Button(
-                label=format_message("changelog_button"),
-                url=format_message("link_changelog_url"),
-                emoji="📜",
-            ),
+            discord.ui.TextDisplay(_VERSION_EGGSPLODE),
+            discord.ui.TextDisplay(_VERSION_PYCORD),
+            accessory=link_button(_CHANGELOG_LINK),
         )
         self.container.add_separator()
-        self.container.add_text(
-            format_message("status_latency", self.app.latency * 1000)
-        )
         uptime = get_uptime()
         self.container.add_text(
-            format_message(
-                "status_uptime",
-                uptime.days,
-                uptime.seconds // 3600,
-                (uptime.seconds // 60) % 60,
-                uptime.seconds % 60,
+            "\n".join(
+                (
+                    _FORMAT_STATUS_LATENCY(self.app.latency * 1000),
+                    _FORMAT_STATUS_UPTIME(
+                        uptime.days,
+                        uptime.seconds // 3600,
+                        (uptime.seconds // 60) % 60,
+                        uptime.seconds % 60,
+                    ),
+                    _FORMAT_STATUS_MEMORY(await get_memory_percent()),
+                )
             )
         )
-        self.container.add_text(
-            format_message("status_memory", psutil.virtual_memory().percent)
-        )
         self.container.add_separator()
-        application_info = await self.app.application_info()
+        application_info = await get_application_info(self.app)
         self.container.add_section(
             discord.ui.TextDisplay(
-                format_message(
-                    "status_installs", application_info.approximate_guild_count
-                )
-            ),
-            accessory=discord.ui.Button(
-                label=format_message("install_button"),
-                url=format_message("link_install_url"),
-                emoji="➕",
+                _FORMAT_STATUS_INSTALLS(application_info.approximate_guild_count)
             ),
+            accessory=link_button(_INSTALL_LINK),
         )
         if self.app.admin_maintenance:
-            self.container.add_text(format_message("maintenance"))
+            self.container.add_text(_STATIC_MESSAGES["maintenance"])
+
+
+def link_button(link: tuple[str, str, str]) -> discord.ui.Button:
+    # Buttons are bound to their view, so each message needs fresh ones
+    label, url, emoji = link
+    return discord.ui.Button(label=label, url=url, emoji=emoji)
 
 
 def get_uptime() -> datetime.timedelta:
-    return datetime.timedelta(seconds=time.time() - psutil.boot_time())
+    return datetime.timedelta(seconds=time.time() - _BOOT_TIME)
+
+
+def get_cached_info(key: str, ttl: float) -> Any | None:
+    cached = _info_cache.get(key)
+    if cached is None or time.monotonic() - cached[0] > ttl:
+        return None
+    return cached[1]
+
+
+def set_cached_info(key: str, value: Any):
+    _info_cache[key] = (time.monotonic(), value)
+
+
+async def get_memory_percent() -> float:
+    memory_percent = get_cached_info("memory", MEMORY_CACHE_TTL)
+    if memory_percent is not None:
+        return memory_percent
+    async with _info_refresh_locks["memory"]:
+        memory_percent = get_cached_info("memory", MEMORY_CACHE_TTL)
+        if memory_percent is None:
+            memory = await asyncio.to_thread(psutil.virtual_memory)
+            memory_percent = memory.percent
+            set_cached_info("memory", memory_percent)
+    return memory_percent
+
+
+async def get_application_info(app: "EggsplodeApp") -> discord.AppInfo:
+    application_info = get_cached_info("application_info", APP_INFO_CACHE_TTL)
+    if application_info is not None:
+        return application_info
+    async with _info_refresh_locks["application_info"]:
+        application_info = get_cached_info("application_info", APP_INFO_CACHE_TTL)
+        if application_info is None:
+            application_info = await app.application_info()
+            set_cached_info("application_info", application_info)
+    return application_info
@@ -32,6 +32,7 @@ class TurnView(BaseGameView):
         self.add_item(self.action_row)
         self.warnings = discord.ui.TextDisplay(self.game.warnings)
         self.add_item(self.warnings)
+        self.deactivated = False
         self.game.events.turn_end.subscribe(self.deactivate, index=0)
         self.game.events.game_end.subscribe(self.deactivate, index=0)
 
@@ -43,6 +44,9 @@ class TurnView(BaseGameView):
         return True
 
     async def deactivate(self):
+        if self.deactivated:
+            return
+        self.deactivated = True
         self.ignore_interactions()
         self.game.events.turn_end -= self.deactivate
         self.game.events.game_end -= self.deactivate
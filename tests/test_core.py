@@ -2,15 +2,23 @@
 Contains tests for the core module.
 """
 
+import asyncio
 import json
 import unittest
 from unittest.mock import AsyncMock, MagicMock
 import discord
 from eggsplode import cards
-from eggsplode.core import Game
+from eggsplode.core import Event, Game
 from eggsplode.strings import available_cards, default_recipes
-from eggsplode.ui.start import COVERED_RECIPE_EXCEPTIONS
+from eggsplode.ui.start import (
+    COVERED_RECIPE_EXCEPTIONS,
+    SettingsModal,
+    StartGameView,
+    get_application_info,
+    get_memory_percent,
+)
 from eggsplode.ui.base import TextView
+from eggsplode.ui.nope import NopeView
 
 
 class TestGameSetup(unittest.TestCase):
@@ -161,6 +169,9 @@ class TestRecipeLoading(unittest.TestCase):
         self.game.load_recipe(r"{}")
         self.assertEqual(self.game.deck, ["eggsplode"])
 
+    def test_returns_parsed_recipe(self):
+        self.assertEqual(self.game.load_recipe(r'{"cards": {}}'), {"cards": {}})
+
     def test_no_dict(self):
         with self.assertRaises(TypeError):
             self.game.load_recipe(r'"test"')
@@ -206,6 +217,38 @@ class TestGameSend(unittest.IsolatedAsyncioTestCase):
         self.game.channel.send.assert_awaited_once()
 
 
+class TestActionTimer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.game = Game(MagicMock(), {"players": [1], "turn_timeout": 0.05})
+
+        async def stop():
+            self.game.active = False
+
+        self.game.on_action_timeout = AsyncMock(side_effect=stop)
+
+    async def test_times_out_after_deadline(self):
+        await asyncio.wait_for(self.game.action_timer(), 1)
+        self.game.on_action_timeout.assert_awaited_once()
+
+    async def test_paused_timer_waits_for_reset(self):
+        self.game.pause()
+        task = asyncio.create_task(self.game.action_timer())
+        await asyncio.sleep(0.1)
+        self.game.on_action_timeout.assert_not_awaited()
+        self.game.paused = False
+        self.game.reset_timer()
+        await asyncio.wait_for(task, 1)
+        self.game.on_action_timeout.assert_awaited_once()
+
+    async def test_end_stops_paused_timer(self):
+        self.game.pause()
+        task = asyncio.create_task(self.game.action_timer())
+        await asyncio.sleep(0)
+        await self.game.end()
+        await asyncio.wait_for(task, 1)
+        self.game.on_action_timeout.assert_not_awaited()
+
+
 class TestPlayerRemoval(unittest.TestCase):
     def setUp(self):
         super().setUp()
@@ -250,3 +293,247 @@ class TestPlayerRemoval(unittest.TestCase):
         self.game.current_player = 1
         self.game.remove_player(3)
         self.assertEqual(self.game.current_player, 1)
+
+
+class TestGroupHand(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.game = Game(MagicMock(), {"players": [1], "recipe": {}})
+        self.game.hands = {1: ["skip", "defuse", "food0", "skip", "food1", "food1"]}
+
+    def test_counts_in_first_seen_order(self):
+        self.assertEqual(
+            list(self.game.group_hand(1).items()),
+            [("skip", 2), ("defuse", 1), ("food0", 1), ("food1", 2)],
+        )
+
+    def test_usable_only_respects_combos(self):
+        self.assertEqual(
+            self.game.group_hand(1, usable_only=True), {"skip": 2, "food1": 2}
+        )
+
+
+class TestAnyPlayerHasCards(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.game = Game(MagicMock(), {"players": [1, 2, 3], "recipe": {}})
+        self.game.hands = {1: ["skip", "skip"], 2: ["nope"], 3: []}
+
+    def test_excludes_player(self):
+        self.assertTrue(self.game.any_player_has_cards(exclude_player_id=1))
+        self.assertFalse(
+            self.game.any_player_has_cards(exclude_player_id=1, min_cards=2)
+        )
+        self.assertTrue(self.game.any_player_has_cards(min_cards=2))
+
+    def test_no_other_players(self):
+        self.game.hands = {1: ["skip"]}
+        self.assertFalse(self.game.any_player_has_cards(exclude_player_id=1))
+
+
+class TestTurnWarnings(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.game = Game(MagicMock(), {"players": [1, 2], "recipe": {}})
+
+    def test_no_trailing_newline_without_radioeggtive(self):
+        self.game.deck = ["radioeggtive_face_up", "eggsplode"]
+        self.assertEqual(self.game.warnings, cards.deck_count(self.game))
+
+    def test_radioeggtive_on_top(self):
+        self.game.deck = ["eggsplode", "radioeggtive_face_up"]
+        warning = cards.radioeggtive_warning(self.game)
+        self.assertTrue(warning)
+        self.assertEqual(
+            self.game.warnings, cards.deck_count(self.game) + "\n" + warning
+        )
+
+
+class TestJoinedPlayers(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.game = Game(MagicMock(), {"players": [1], "recipe": {}})
+
+    def test_add_joined_player(self):
+        self.game.add_joined_player(2)
+        self.assertEqual(self.game.config["players"], [1, 2])
+        self.assertIn(2, self.game.joined_players)
+
+    def test_remove_joined_player(self):
+        self.game.add_joined_player(2)
+        self.game.remove_joined_player(1)
+        self.assertEqual(self.game.config["players"], [2])
+        self.assertNotIn(1, self.game.joined_players)
+
+    def test_creator_moves_to_next_player(self):
+        self.game.add_joined_player(2)
+        self.assertEqual(self.game.creator_id, 1)
+        self.game.remove_joined_player(1)
+        self.assertEqual(self.game.creator_id, 2)
+        self.game.remove_joined_player(2)
+        self.assertIsNone(self.game.creator_id)
+
+    def test_player_list_updates_on_join(self):
+        self.assertEqual(self.game.player_list, "- <@1>")
+        self.game.add_joined_player(2)
+        self.assertEqual(self.game.player_list, "- <@1>\n- <@2>")
+
+    def test_player_list_updates_on_leave(self):
+        self.game.add_joined_player(2)
+        self.assertEqual(self.game.player_list, "- <@1>\n- <@2>")
+        self.game.remove_joined_player(1)
+        self.assertEqual(self.game.player_list, "- <@2>")
+        self.game.remove_joined_player(2)
+        self.game.add_joined_player(3)
+        self.assertEqual(self.game.player_list, "- <@3>")
+
+
+class TestSettingsValidation(unittest.TestCase):
+    def test_validate_casts_value(self):
+        self.assertEqual(SettingsModal.validate("15", int, 10, 120), (True, ""))
+
+    def test_validate_wrong_type(self):
+        self.assertFalse(SettingsModal.validate("abc", int)[0])
+
+    def test_validate_zero_minimum(self):
+        self.assertFalse(SettingsModal.validate("-1", int, min_value=0)[0])
+        self.assertFalse(SettingsModal.validate("1", int, max_value=0)[0])
+
+
+class TestStartGameView(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.game = Game(MagicMock(), {"players": [1]})
+        self.view = StartGameView(self.game)
+        self.view.message = MagicMock()
+        self.view.message.edit = AsyncMock()
+
+    @staticmethod
+    def join_interaction(user_id: int) -> MagicMock:
+        interaction = MagicMock()
+        interaction.user.id = user_id
+        interaction.response.defer = AsyncMock()
+        interaction.respond = AsyncMock()
+        interaction.edit_original_response = AsyncMock()
+        return interaction
+
+    async def test_players_update_coalesces_joins(self):
+        self.game.add_joined_player(2)
+        self.view.schedule_players_update()
+        self.game.add_joined_player(3)
+        self.view.schedule_players_update()
+        await self.view.players_update_task
+        self.view.message.edit.assert_awaited_once()
+        self.assertEqual(self.view.players_display.content, "- <@1>\n- <@2>\n- <@3>")
+
+    async def test_delayed_update_after_leave_edits_join_interaction(self):
+        rejoin = self.join_interaction(1)
+        await self.view.join_game(self.join_interaction(2))
+        await self.view.join_game(self.join_interaction(3))
+        await self.view.join_game(rejoin)
+        await self.view.remove_player(3)
+        await self.view.players_update_task
+        rejoin.edit_original_response.assert_awaited_once_with(view=self.view)
+        self.view.message.edit.assert_not_awaited()
+
+    async def test_failed_players_update_is_retried(self):
+        self.view.message.edit.side_effect = discord.HTTPException(
+            MagicMock(status=500), "error"
+        )
+        self.game.add_joined_player(2)
+        await self.view.update_players_display()
+        self.view.message.edit.side_effect = None
+        await self.view.update_players_display()
+        self.assertEqual(self.view.message.edit.await_count, 2)
+        self.assertEqual(self.view.rendered_players, (1, 2))
+
+    async def test_players_update_edits_latest_interaction(self):
+        first, latest = self.join_interaction(2), self.join_interaction(3)
+        await self.view.join_game(first)
+        await self.view.join_game(latest)
+        await self.view.players_update_task
+        latest.edit_original_response.assert_awaited_once_with(view=self.view)
+        first.edit_original_response.assert_not_awaited()
+        self.view.message.edit.assert_not_awaited()
+
+    async def test_leave_view_is_reused(self):
+        leave_view = self.view.get_leave_view(1)
+        self.assertIs(self.view.get_leave_view(1), leave_view)
+        leave_view.ignore_interactions()
+        self.assertIsNot(self.view.get_leave_view(1), leave_view)
+
+    async def test_terminate_view_unsubscribes(self):
+        self.view.terminate_view()
+        self.assertNotIn(self.view.terminate_view, self.game.events.game_end)
+
+    async def test_terminate_view_keeps_header_only(self):
+        self.view.terminate_view()
+        self.assertEqual(self.view.children, [self.view.header])
+
+    async def test_last_player_leaving_ends_game_before_edit(self):
+        await self.view.remove_player(1)
+        self.assertFalse(self.game.active)
+        self.assertEqual(self.view.children, [self.view.header])
+        self.view.message.edit.assert_awaited_once_with(view=self.view)
+
+
+class TestInfoCache(unittest.IsolatedAsyncioTestCase):
+    async def test_memory_read_not_blocked_by_app_info_refresh(self):
+        refresh_started = asyncio.Event()
+        release_refresh = asyncio.Event()
+
+        async def application_info():
+            refresh_started.set()
+            await release_refresh.wait()
+            return MagicMock()
+
+        app = MagicMock()
+        app.application_info = application_info
+        refresh = asyncio.create_task(get_application_info(app))
+        await refresh_started.wait()
+        await asyncio.wait_for(get_memory_percent(), 5)
+        release_refresh.set()
+        await refresh
+
+
+class TestNopeTimer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.game = Game(MagicMock(), {"players": [1, 2]})
+        self.timed_out = asyncio.Event()
+        self.ok_callback_action = AsyncMock(side_effect=lambda _: self.timed_out.set())
+        self.view = NopeView(
+            self.game,
+            "message",
+            ok_callback_action=self.ok_callback_action,
+            timeout=0.1,
+        )
+
+    async def test_times_out(self):
+        await self.view.start_timer()
+        await asyncio.wait_for(self.timed_out.wait(), 1)
+        self.ok_callback_action.assert_awaited_once_with(None)
+
+    async def test_reset_restarts_countdown(self):
+        self.view.nope_timeout = 0.5
+        await self.view.start_timer()
+        await asyncio.sleep(0.3)
+        self.view.reset_timeout()
+        await asyncio.sleep(0.3)
+        self.ok_callback_action.assert_not_awaited()
+        await asyncio.wait_for(self.timed_out.wait(), 1)
+        self.ok_callback_action.assert_awaited_once_with(None)
+
+
+class TestEvent(unittest.IsolatedAsyncioTestCase):
+    async def test_sequential_handlers(self):
+        calls = []
+        event = Event()
+
+        async def handler():
+            calls.append("start")
+            await asyncio.sleep(0.01)
+            calls.append("end")
+
+        event += handler
+        event += handler
+        await event()
+        self.assertEqual(calls, ["start", "end", "start", "end"])